@@ -1,10 +1,13 @@
 """Support for monitoring if a sensor value is below/above a threshold."""
 from __future__ import annotations
 
+import bisect
+import heapq
 import logging
+from operator import attrgetter
 from typing import Any
 
-from datetime import time, timedelta, datetime
+from datetime import date, time, timedelta, datetime
 
 import homeassistant.util.dt as dt_util
 from homeassistant.components.binary_sensor import (
@@ -47,6 +50,7 @@ from .const import (
     CONF_INTERVAL_MODE,
 )
 from .util import (
+    Marketprice,
     get_marketdata_from_sensor_attrs,
 )
 from .intermittent_interval import (
@@ -57,6 +61,10 @@ from .contiguous_interval import calc_interval_for_contiguous
 
 _LOGGER = logging.getLogger(__name__)
 
+_MODE_INTERMITTENT = IntervalModes.INTERMITTENT.value
+_MODE_CONTIGUOUS = IntervalModes.CONTIGUOUS.value
+_PRICE_MOST_EXPENSIVE = PriceModes.MOST_EXPENSIVE.value
+
 DURATION_UOM_MAP = {
     "d": "days",
     "days": "days",
@@ -158,17 +166,33 @@ class BinarySensor(BinarySensorEntity):
         self._duration_entity_id = duration_entity_id
         self._price_mode = price_mode
         self._interval_mode = interval_mode
+        self._most_expensive = price_mode == _PRICE_MOST_EXPENSIVE
+
+        if interval_mode == _MODE_INTERMITTENT:
+            self._update_mode = self._update_state_for_intermittent
+        elif interval_mode == _MODE_CONTIGUOUS:
+            self._update_mode = self._update_state_for_contiguous
+        else:
+            self._update_mode = None
 
         # price sensor values
         self._sensor_attributes = None
-        self._cached_marketdata = []
+        self._cached_marketdata: list[Marketprice] = []
+        self._cached_start_times: list[datetime] = []
+        self._last_marketdata: list[Marketprice] | None = None
 
         # calculated values
         self._duration: timedelta = self._default_duration
+        self._duration_entity_state = None
+        self._duration_from_entity: timedelta | None = None
         self._interval_start_time = None
         self._interval_enabled: bool = False
         self._state: bool | None = None
         self._intervals: list | None = None
+        self._intervals_sig: tuple | None = None
+        self._next_update: datetime | None = None
+        self._last_written: tuple | None = None
+        self._window_cache: tuple[date, datetime, datetime] | None = None
 
         @callback
         def async_update_state(
@@ -220,12 +244,33 @@ class BinarySensor(BinarySensorEntity):
 
     @callback
     def _update_state(self) -> None:
+        now = dt_util.now()
+        new_state = self._hass.states.get(self._entity_id)
+        duration_state = (
+            self._hass.states.get(self._duration_entity_id)
+            if self._duration_entity_id is not None
+            else None
+        )
+
+        # skip update if neither the source states changed nor an interval
+        # boundary has been reached since the last update
+        if (
+            self._next_update is not None
+            and now < self._next_update
+            and new_state is not None
+            and new_state.attributes is self._sensor_attributes
+            and duration_state is self._duration_entity_state
+        ):
+            return
+
+        self._next_update = None
+
         # set to unavailable by default
         self._sensor_attributes = None
         self._state = None
 
         # get price sensor attributes first
-        if (new_state := self._hass.states.get(self._entity_id)) is None:
+        if new_state is None:
             # _LOGGER.warning(f"Can't get states of {self._entity_id}")
             return
 
@@ -235,13 +280,7 @@ class BinarySensor(BinarySensorEntity):
             _LOGGER.warning(f"Can't get attributes of {self._entity_id}")
             return
 
-        now = dt_util.now()
-
-        # earliest_start always refers to today
-        earliest_start = datetime.combine(now, self._earliest_start_time, now.tzinfo)
-
-        # latest_end may refer to today or tomorrow
-        latest_end = datetime.combine(now, self._latest_end_time, now.tzinfo)
+        earliest_start, latest_end = self._compute_window(now)
 
         if self._latest_end_time <= self._earliest_start_time:
             # start and end refers to different days
@@ -261,32 +300,82 @@ class BinarySensor(BinarySensorEntity):
         self._interval_start_time = earliest_start
 
         # calculate the actual duration (in case a duration entity is configured)
-        self._calculate_duration()
+        self._calculate_duration(duration_state)
 
-        if self._interval_mode == IntervalModes.INTERMITTENT.value:
-            self._update_state_for_intermittent(
-                self._interval_start_time, latest_end, now
-            )
-        elif self._interval_mode == IntervalModes.CONTIGUOUS.value:
-            self._update_state_for_contiguous(
-                self._interval_start_time, latest_end, now
-            )
+        if self._update_mode is not None:
+            edges = self._update_mode(self._interval_start_time, latest_end, now)
         else:
             _LOGGER.error(f"invalid interval mode: {self._interval_mode}")
+            edges = []
+
+        if self._state is not None:
+            # next time at which the state or attributes may change:
+            # interval edges, enabled flag flips, the next day and the next
+            # outdated market data entry (see _get_marketdata).
+            # Each edge must be computed the same way as the comparison with
+            # now that it predicts, otherwise a needed update is skipped.
+            tomorrow = datetime.combine(
+                now.date() + timedelta(days=1), time(), now.tzinfo
+            )
+            if self._cached_start_times:
+                # same wall clock arithmetic as the cutoff in _get_marketdata
+                edges.append(
+                    self._cached_start_times[0].astimezone(now.tzinfo)
+                    + timedelta(days=1, microseconds=1)
+                )
+            self._next_update = min(
+                (
+                    t
+                    for t in (
+                        *edges,
+                        earliest_start,
+                        latest_end,
+                        latest_end + timedelta(microseconds=1),
+                        tomorrow,
+                    )
+                    if t > now
+                ),
+                default=None,
+            )
 
-        self.async_write_ha_state()
+        # write state only if state or attributes have changed
+        written = (
+            self._state,
+            self._intervals,
+            self._interval_enabled,
+            self._interval_start_time,
+            self._duration,
+        )
+        if written != self._last_written:
+            self._last_written = written
+            self.async_write_ha_state()
+
+    def _compute_window(self, now: datetime) -> tuple[datetime, datetime]:
+        """Return earliest_start and latest_end for today, cached per day."""
+        today = now.date()
+        if (cached := self._window_cache) is not None and cached[0] == today:
+            return cached[1], cached[2]
+
+        # earliest_start always refers to today
+        earliest_start = datetime.combine(now, self._earliest_start_time, now.tzinfo)
+
+        # latest_end may refer to today or tomorrow
+        latest_end = datetime.combine(now, self._latest_end_time, now.tzinfo)
+
+        self._window_cache = (today, earliest_start, latest_end)
+        return earliest_start, latest_end
 
     def _update_state_for_intermittent(
         self, earliest_start: time, latest_end: time, now: datetime
-    ):
-        marketdata = self._get_marketdata()
+    ) -> list[datetime]:
+        marketdata = self._get_marketdata(now)
 
         intervals = calc_intervals_for_intermittent(
             marketdata=marketdata,
             earliest_start=earliest_start,
             latest_end=latest_end,
             duration=self._duration,
-            most_expensive=self._price_mode == PriceModes.MOST_EXPENSIVE.value,
+            most_expensive=self._most_expensive,
         )
 
         if intervals is None:
@@ -295,7 +384,8 @@ class BinarySensor(BinarySensorEntity):
                 # we are before the start time, o we just say sensor-state=off instead of unavailable # noqa: E501
                 self._state = False
                 self._intervals = []
-            return
+                self._intervals_sig = None
+            return []
 
         self._state = is_now_in_intervals(now, intervals)
 
@@ -310,32 +400,41 @@ class BinarySensor(BinarySensorEntity):
                 earliest_start=earliest_start,
                 latest_end=latest_end,
                 duration=self._duration,
-                most_expensive=self._price_mode == PriceModes.MOST_EXPENSIVE.value,
+                most_expensive=self._most_expensive,
             )
 
             if intervals2 is not None:
                 intervals = [*intervals, *intervals2]
 
-        self._intervals = [
-            {
-                ATTR_START_TIME: dt_util.as_local(e.start_time).isoformat(),
-                ATTR_END_TIME: dt_util.as_local(e.end_time).isoformat(),
-                ATTR_RANK: e.rank,
-            }
-            for e in sorted(intervals, key=lambda e: e.start_time)
-        ]
+        intervals.sort(key=attrgetter("start_time"))
+
+        # rebuild attributes only if intervals have changed
+        sig = tuple((e.start_time, e.end_time, e.rank, e.price) for e in intervals)
+        if sig != self._intervals_sig:
+            self._intervals_sig = sig
+            tz = now.tzinfo
+            self._intervals = [
+                {
+                    ATTR_START_TIME: e.start_time.astimezone(tz).isoformat(),
+                    ATTR_END_TIME: e.end_time.astimezone(tz).isoformat(),
+                    ATTR_RANK: e.rank,
+                }
+                for e in intervals
+            ]
+
+        return [t for e in intervals for t in (e.start_time, e.end_time)]
 
     def _update_state_for_contiguous(
         self, earliest_start: time, latest_end: time, now: datetime
-    ):
-        marketdata = self._get_marketdata()
+    ) -> list[datetime]:
+        marketdata = self._get_marketdata(now)
 
         result = calc_interval_for_contiguous(
             marketdata,
             earliest_start=earliest_start,
             latest_end=latest_end,
             duration=self._duration,
-            most_expensive=self._price_mode == PriceModes.MOST_EXPENSIVE.value,
+            most_expensive=self._most_expensive,
         )
 
         if result is None:
@@ -344,17 +443,11 @@ class BinarySensor(BinarySensorEntity):
                 # we are before the start time, o we just say sensor-state=off instead of unavailable # noqa: E501
                 self._state = False
                 self._intervals = []
-            return
+                self._intervals_sig = None
+            return []
 
         self._state = result["start"] <= now < result["end"]
-
-        self._intervals = [
-            {
-                ATTR_START_TIME: dt_util.as_local(result["start"]).isoformat(),
-                ATTR_END_TIME: dt_util.as_local(result["end"]).isoformat(),
-                # "interval_price": result["interval_price"],
-            }
-        ]
+        results = [result]
 
         # try to calculate intervals for next day also
         earliest_start += timedelta(days=1)
@@ -367,20 +460,29 @@ class BinarySensor(BinarySensorEntity):
                 earliest_start=earliest_start,
                 latest_end=latest_end,
                 duration=self._duration,
-                most_expensive=self._price_mode == PriceModes.MOST_EXPENSIVE.value,
+                most_expensive=self._most_expensive,
             )
 
-            if result is None:
-                return
+            if result is not None:
+                results.append(result)
 
-            self._intervals.append(
+        # rebuild attributes only if intervals have changed
+        sig = tuple((r["start"], r["end"], r["interval_price"]) for r in results)
+        if sig != self._intervals_sig:
+            self._intervals_sig = sig
+            tz = now.tzinfo
+            self._intervals = [
                 {
-                    ATTR_START_TIME: dt_util.as_local(result["start"]).isoformat(),
-                    ATTR_END_TIME: dt_util.as_local(result["end"]).isoformat(),
+                    ATTR_START_TIME: r["start"].astimezone(tz).isoformat(),
+                    ATTR_END_TIME: r["end"].astimezone(tz).isoformat(),
+                    # "interval_price": r["interval_price"],
                 }
-            )
+                for r in results
+            ]
+
+        return [t for r in results for t in (r["start"], r["end"])]
 
-    def _get_marketdata(self):
+    def _get_marketdata(self, now: datetime):
         try:
             marketdata = get_marketdata_from_sensor_attrs(self._sensor_attributes)
         except KeyError as error:
@@ -389,44 +491,67 @@ class BinarySensor(BinarySensorEntity):
             )
             return []
 
-        # now merge it with the cached info
-        marketdata = [*marketdata, *self._cached_marketdata]
+        # now merge it with the cached info (skip if source data is unchanged)
+        if marketdata is not self._last_marketdata:
+            self._last_marketdata = marketdata
+            # don't rely on the source data being sorted and free of duplicates
+            # (the last entry for a start time wins)
+            marketdata = sorted(
+                {e.start_time: e for e in marketdata}.values(),
+                key=attrgetter("start_time"),
+            )
+            cache = self._cached_marketdata
+            cache_start_times = self._cached_start_times
+
+            # cached entries before the fresh data are kept as they are
+            idx = (
+                bisect.bisect_left(cache_start_times, marketdata[0].start_time)
+                if marketdata
+                else len(cache)
+            )
+            merged = cache[:idx]
+            for e in heapq.merge(cache[idx:], marketdata, key=attrgetter("start_time")):
+                # eliminate duplicates, cached data takes precedence
+                if not merged or merged[-1].start_time != e.start_time:
+                    merged.append(e)
+            self._cached_marketdata = merged
+            self._cached_start_times = [
+                *cache_start_times[:idx],
+                *(e.start_time for e in merged[idx:]),
+            ]
 
         # remove outdated entries (exact time doesn't matter)
-        start_time = dt_util.now() - timedelta(days=1)
-        marketdata = filter(lambda e: e.start_time >= start_time, marketdata)
-
-        # eliminate duplicates
-        dummy = {e.start_time: e for e in marketdata}
-
-        # sort by start_time again
-        marketdata = sorted(dummy.values(), key=lambda e: e.start_time)
-
-        self._cached_marketdata = marketdata
+        start_time = now - timedelta(days=1)
+        if (idx := bisect.bisect_left(self._cached_start_times, start_time)) > 0:
+            del self._cached_marketdata[:idx]
+            del self._cached_start_times[:idx]
 
-        return marketdata
+        return self._cached_marketdata
 
-    def _calculate_duration(self):
+    def _calculate_duration(self, duration_entity_state):
         self._duration = self._default_duration
 
-        if self._duration_entity_id is None:
+        # parse duration only if duration entity state has changed
+        if duration_entity_state is not self._duration_entity_state:
+            duration = None
+            if duration_entity_state is not None:
+                uom = duration_entity_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+                if uom not in DURATION_UOM_MAP:
+                    _LOGGER.error(
+                        f'Invalid unit of measurement "{uom}" for duration entity {self._duration_entity_id}.\n'  # noqa
+                        "Valid unit of measurements: d, h, min, s, ms"
+                    )
+                else:
+                    duration = cv.time_period_dict(
+                        {DURATION_UOM_MAP[uom]: float(duration_entity_state.state)}
+                    )
+            self._duration_entity_state = duration_entity_state
+            self._duration_from_entity = duration
+
+        if self._duration_from_entity is None:
             return
 
-        duration_entity_state = self._hass.states.get(self._duration_entity_id)
-        if duration_entity_state is None:
-            return
-
-        uom = duration_entity_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-        if uom not in DURATION_UOM_MAP:
-            _LOGGER.error(
-                f'Invalid unit of measurement "{uom}" for duration entity {self._duration_entity_id}.\n'  # noqa
-                "Valid unit of measurements: d, h, min, s, ms"
-            )
-            return
-
-        self._duration = cv.time_period_dict(
-            {DURATION_UOM_MAP[uom]: float(duration_entity_state.state)}
-        )
+        self._duration = self._duration_from_entity
 
         # set interval start time to duration entity last_changed
         # if duration entity is changed within interval
@@ -1,3 +1,4 @@
+import bisect
 import logging
 from datetime import datetime, timedelta
 
@@ -7,21 +8,24 @@ _LOGGER = logging.getLogger(__name__)
 SECONDS_PER_HOUR = 60 * 60
 
 
-def _find_market_price(marketdata, dt: datetime):
-    for mp in marketdata:
-        if dt >= mp.start_time and dt < mp.end_time:
-            return mp
+def _find_market_price(marketdata, md_start_times, dt: datetime):
+    """Find market price segment for dt; marketdata must be sorted by start_time."""
+    idx = bisect.bisect_right(md_start_times, dt) - 1
+    if idx >= 0 and dt < marketdata[idx].end_time:
+        return marketdata[idx]
 
     return None
 
 
-def _calc_interval_price(marketdata, start_time: datetime, duration: timedelta):
+def _calc_interval_price(
+    marketdata, md_start_times, start_time: datetime, duration: timedelta
+):
     """Calculate price for given start time and duration."""
     total_price = 0
     stop_time = start_time + duration
 
     while start_time < stop_time:
-        mp = _find_market_price(marketdata, start_time)
+        mp = _find_market_price(marketdata, md_start_times, start_time)
 
         if mp.end_time > stop_time:
             active_duration_in_this_segment = stop_time - start_time
@@ -89,8 +93,10 @@ def _find_extreme_price_interval(
         def cmp(a, b):
             return a < b
 
+    md_start_times = [mp.start_time for mp in marketdata]
+
     for start_time in start_times:
-        ip = _calc_interval_price(marketdata, start_time, duration)
+        ip = _calc_interval_price(marketdata, md_start_times, start_time, duration)
 
         if ip is None:
             return None
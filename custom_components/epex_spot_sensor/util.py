@@ -1,59 +1,83 @@
 import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import NamedTuple
 
 from homeassistant.helpers import (
     config_validation as cv,
 )
 
+from .const import ATTR_DATA, ATTR_END_TIME, ATTR_START_TIME
+
 _LOGGER = logging.getLogger(__name__)
 
+# supported price attributes and their unit of measurement, in order of precedence
+_PRICE_FIELDS: tuple[tuple[str, str], ...] = (
+    ("price_eur_per_mwh", "EUR/MWh"),
+    ("price_gbp_per_mwh", "GBP/MWh"),
+    ("price_ct_per_kwh", "ct/kWh"),
+    ("price_pence_per_kwh", "pence/kWh"),
+    ("price_per_kwh", "€/£/kWh"),
+)
 
-class Marketprice:
-    def __init__(self, entry):
-        self._start_time = cv.datetime(entry["start_time"])
-        self._end_time = cv.datetime(entry["end_time"])
-        if (x := entry.get("price_eur_per_mwh")) is not None:
-            self._price = x
-            self._price_uom = "EUR/MWh"
-        elif (x := entry.get("price_gbp_per_mwh")) is not None:
-            self._price = x
-            self._price_uom = "GBP/MWh"
-        elif (x := entry.get("price_ct_per_kwh")) is not None:
-            self._price = x
-            self._price_uom = "ct/kWh"
-        elif (x := entry.get("price_pence_per_kwh")) is not None:
-            self._price = x
-            self._price_uom = "pence/kWh"
-        elif (x := entry.get("price_per_kwh")) is not None:
-            self._price = x
-            self._price_uom = "€/£/kWh"
-        else:
-            raise KeyError("No valid price field found.")
+# converted market data, keyed by id() of the source "data" attribute;
+# the source object itself is kept to validate the entry (ids may be reused)
+_MD_CACHE_SIZE = 4
+_MD_CACHE: OrderedDict[int, tuple[object, list]] = OrderedDict()
 
-    def __repr__(self):
-        return f"{self.__class__.__name__}(start: {self._start_time.isoformat()}, end: {self._end_time.isoformat()}, marketprice: {self._price} {self._price_uom})"  # noqa: E501
 
-    @property
-    def start_time(self):
-        return self._start_time
+def _parse_datetime(value) -> datetime:
+    """Parse an ISO timestamp, falling back to the (slower) HA validator."""
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return cv.datetime(value)
+
 
-    @property
-    def end_time(self):
-        return self._end_time
+class Marketprice(NamedTuple):
+    start_time: datetime
+    end_time: datetime
+    price: float
+    price_uom: str
 
-    @property
-    def price(self):
-        return self._price
+    @classmethod
+    def from_entry(cls, entry):
+        get = entry.get
+        for key, uom in _PRICE_FIELDS:
+            if (x := get(key)) is not None:
+                break
+        else:
+            raise KeyError("No valid price field found.")
 
-    @property
-    def price_uom(self):
-        return self._price_uom
+        return cls(
+            _parse_datetime(entry[ATTR_START_TIME]),
+            _parse_datetime(entry[ATTR_END_TIME]),
+            x,
+            uom,
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(start: {self.start_time.isoformat()}, end: {self.end_time.isoformat()}, marketprice: {self.price} {self.price_uom})"  # noqa: E501
 
 
 def get_marketdata_from_sensor_attrs(attributes):
     """Convert sensor attributes to market price list."""
     try:
-        data = attributes["data"]
+        data = attributes[ATTR_DATA]
     except KeyError:
         raise KeyError("'data' missing in sensor attributes")
 
-    return [Marketprice(e) for e in data]
+    key = id(data)
+    if (cached := _MD_CACHE.get(key)) is not None and cached[0] is data:
+        _MD_CACHE.move_to_end(key)
+        return cached[1]
+
+    marketdata = [Marketprice.from_entry(e) for e in data]
+
+    _MD_CACHE[key] = (data, marketdata)
+    while len(_MD_CACHE) > _MD_CACHE_SIZE:
+        _MD_CACHE.popitem(last=False)
+
+    return marketdata